@@ -0,0 +1,32 @@
+"""
+College configuration for the ZJU bulletin board scraper (see scrape.py).
+All sites run ZJU WebPlus CMS: list pages are …/list.htm, list2.htm, …
+"""
+
+# ─── College configuration ────────────────────────────────────────────────────
+# 注：计算机学院通知页 cspo.zju.edu.cn 仅校内网可访问，暂时使用公开新闻页代替。
+COLLEGES = [
+    {
+        "id": "sis",
+        "name": "外国语学院",
+        "list_url": "http://www.sis.zju.edu.cn/sischinese/12577/list.htm",
+        "base_url": "http://www.sis.zju.edu.cn",
+    },
+    {
+        "id": "cs",
+        "name": "计算机科学与技术学院",
+        # cspo.zju.edu.cn 仅校内网可访问，暂用公开新闻动态页
+        "list_url": "http://www.cs.zju.edu.cn/csen/xwdt_38564/list.htm",
+        "base_url": "http://www.cs.zju.edu.cn",
+        "note": "⚠️ 通知公告页仅限校内网，当前显示公开新闻动态",
+    },
+    {
+        "id": "ckc",
+        "name": "竺可桢学院",
+        "list_url": "http://ckc.zju.edu.cn/54005/list.htm",
+        "base_url": "http://ckc.zju.edu.cn",
+    },
+]
+
+# How many list pages to fetch per college (each page has ~14-15 items)
+PAGES_TO_FETCH = 2
@@ -4,46 +4,64 @@ ZJU College Bulletin Board Scraper
 Scrapes the latest notices from ZJU college websites and outputs docs/data.json
 """
 
+import codecs
 import json
 import logging
+import multiprocessing
 import os
 import re
+import threading
 import time
+from collections.abc import Iterable
+from concurrent.futures import (Executor, Future, ProcessPoolExecutor,
+                                ThreadPoolExecutor, as_completed)
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone, timedelta
+from urllib.parse import urljoin, urlsplit
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from .config import COLLEGES, PAGES_TO_FETCH
+except ImportError:
+    # Run as a script (python scraper/scrape.py): scraper/ itself is on sys.path
+    from config import COLLEGES, PAGES_TO_FETCH
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# On-disk HTTP cache with ETag / Last-Modified revalidation; plain requests without it
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# selectolax's Lexbor engine keeps the DOM in C and only builds Python objects
+# for the nodes we touch; several times faster than lxml, which is the fallback
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 log = logging.getLogger(__name__)
 
-# ─── College configuration ────────────────────────────────────────────────────
-# 注：计算机学院通知页 cspo.zju.edu.cn 仅校内网可访问，暂时使用公开新闻页代替。
-COLLEGES = [
-    {
-        "id": "sis",
-        "name": "外国语学院",
-        "list_url": "http://www.sis.zju.edu.cn/sischinese/12577/list.htm",
-        "base_url": "http://www.sis.zju.edu.cn",
-    },
-    {
-        "id": "cs",
-        "name": "计算机科学与技术学院",
-        # cspo.zju.edu.cn 仅校内网可访问，暂用公开新闻动态页
-        "list_url": "http://www.cs.zju.edu.cn/csen/xwdt_38564/list.htm",
-        "base_url": "http://www.cs.zju.edu.cn",
-        "note": "⚠️ 通知公告页仅限校内网，当前显示公开新闻动态",
-    },
-    {
-        "id": "ckc",
-        "name": "竺可桢学院",
-        "list_url": "http://ckc.zju.edu.cn/54005/list.htm",
-        "base_url": "http://ckc.zju.edu.cn",
-    },
-]
-
-# How many list pages to fetch per college (each page has ~14-15 items)
-PAGES_TO_FETCH = 2
+# Concurrent list-page downloads overall, and per host (to stay polite)
+MAX_WORKERS = 8
+MAX_PER_HOST = 2
+# Minimum spacing in seconds between requests to the same host
+MIN_HOST_INTERVAL = 1.0
+
+# Parse in worker processes once a run fetches at least this many pages.
+# With Lexbor a list page parses in about a millisecond, so below this (the
+# default 3 colleges x 2 pages included) process start-up outweighs the gain.
+PARALLEL_PARSE_MIN_JOBS = 12
 
 HEADERS = {
     "User-Agent": (
@@ -55,151 +73,451 @@ HEADERS = {
     "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
 }
 
-SESSION = requests.Session()
-SESSION.headers.update(HEADERS)
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Both caches live in .cache/, which is not committed; CI keeps it between
+# runs with actions/cache.
+# requests-cache's sqlite store: response bodies plus ETag / Last-Modified, so
+# an expired page is revalidated and an unchanged one (HTTP 304) costs no body.
+HTTP_CACHE_PATH = os.path.join(REPO_ROOT, ".cache", "http_cache.sqlite")
+HTTP_CACHE_EXPIRE_AFTER = 900
+# Items parsed from each URL's cached response, tagged with that response's
+# validators, so a page served from HTTP_CACHE_PATH is not parsed again.
+PAGE_CACHE_PATH = os.path.join(REPO_ROOT, ".cache", "pages.json")
+# Stored with each PAGE_CACHE_PATH entry (see _parsed_by); entries from another
+# version are parsed again. Bump it whenever a parser change alters the items
+# a page yields, so CI's restored cache does not keep serving the old ones.
+PAGE_PARSER_VERSION = 3
 
 # Regex: ZJU WebPlus article URL pattern  e.g. /2026/0213/c12577a3134640/page.htm
-ARTICLE_URL_RE = re.compile(r"/\d{4}/\d{4}/[^/]+/page\.htm$")
+ARTICLE_URL_RE = re.compile(r"/\d{4}/\d{4}/[^/]+/page\.htm$", re.ASCII)
 
 # Date pattern in text:  YYYY-MM-DD
-DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}", re.ASCII)
+
+# Start of data.json as write_output lays it out, up to the colleges data:
+# only the updated_at value may differ between two runs with the same notices
+OUTPUT_HEAD_RE = re.compile(rb'\{\n  "updated_at": "[^"\\\n]*",\n  "colleges": ')
+
+# Declared charsets: Content-Type header, or <meta charset> / http-equiv in the <head>
+HEADER_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.ASCII | re.IGNORECASE)
+META_CHARSET_RE = re.compile(rb"<meta[^>]+charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+
+# Bound once so the per-anchor / per-row loops skip the attribute lookup
+ARTICLE_URL_SEARCH = ARTICLE_URL_RE.search
+DATE_SEARCH = DATE_RE.search
+
+# Anchors whose href ends in /page.htm -- a plain suffix compare inside libxml2,
+# so ARTICLE_URL_RE only runs on candidates, not on every nav/footer link
+ARTICLE_LINK_XPATH = etree.XPath(
+    "//a[substring(@href, string-length(@href) - 8) = '/page.htm']"
+)
+
+
+@dataclass(slots=True)
+class Item:
+    """One notice on a list page."""
+    title: str
+    url: str
+    date: str  # YYYY-MM-DD, or "" if the row shows none
 
 
 # ─── Page fetching ─────────────────────────────────────────────────────────────
 
-def make_page_url(base_list_url: str, page: int) -> str:
-    """Convert list.htm → list2.htm → list3.htm …"""
-    if page == 1:
-        return base_list_url
-    return base_list_url.replace("/list.htm", f"/list{page}.htm")
+def college_page_urls(college: dict) -> list[str]:
+    """First PAGES_TO_FETCH list pages:  list.htm → list2.htm → list3.htm …"""
+    list_url = college["list_url"]
+    prefix = list_url[:-len("list.htm")]
+    return [list_url] + [f"{prefix}list{page_no}.htm"
+                         for page_no in range(2, PAGES_TO_FETCH + 1)]
 
 
-def fetch_page(url: str, retries: int = 3) -> BeautifulSoup | None:
-    """Fetch a page and return parsed HTML."""
-    for attempt in range(1, retries + 1):
-        try:
-            resp = SESSION.get(url, timeout=20)
-            resp.encoding = resp.apparent_encoding or "utf-8"
-            return BeautifulSoup(resp.text, "html.parser")
-        except Exception as exc:
-            log.warning("  [WARN] attempt %d/%d failed for %s: %s",
-                        attempt, retries, url, exc)
-            time.sleep(3 * attempt)
-    return None
+def _row_date(row_text: str, link_text: str) -> str:
+    """
+    First YYYY-MM-DD in a row's text outside the link's own text: titles such as
+    "2026-03-15至2026-03-20停电" quote dates that are not the publication date.
+    """
+    start = row_text.find(link_text)
+    if start < 0:
+        m = DATE_SEARCH(row_text)
+    else:
+        m = DATE_SEARCH(row_text, 0, start) or DATE_SEARCH(row_text, start + len(link_text))
+    return m.group() if m else ""
 
 
-def parse_items(soup: BeautifulSoup, base_url: str) -> list[dict]:
+def parse_items(tree: lxml.html.HtmlElement, base_url: str) -> dict[str, Item]:
     """
-    Extract notice items from a list page.
+    Extract notice items from a list page, keyed by absolute URL in page order.
     ZJU WebPlus CMS structure:  <li><a href="...page.htm">title</a><span>date</span></li>
     """
-    items = []
-    seen_urls = set()
+    items: dict[str, Item] = {}
 
-    for a_tag in soup.find_all("a", href=ARTICLE_URL_RE):
-        href = a_tag["href"].strip()
-        title = a_tag.get_text(strip=True)
+    for a_tag in ARTICLE_LINK_XPATH(tree):
+        href = a_tag.get("href")
+        if not ARTICLE_URL_SEARCH(href):
+            continue
+        href = href.strip()
+        title = "".join(t.strip() for t in a_tag.itertext())
 
         if not title:
             continue
 
-        # Build absolute URL
-        if href.startswith("http"):
-            full_url = href
-        else:
-            full_url = base_url.rstrip("/") + href
+        # Build absolute URL (handles absolute, root-relative and ../ hrefs)
+        full_url = urljoin(base_url, href)
 
-        if full_url in seen_urls:
+        if full_url in items:
             continue
-        seen_urls.add(full_url)
-
-        # Date: look in sibling/parent text for YYYY-MM-DD
-        date = ""
-        parent = a_tag.parent  # <li>
-        if parent:
-            # Prefer a <span> sibling containing digits
-            for span in parent.find_all("span"):
-                m = DATE_RE.search(span.get_text())
-                if m:
-                    date = m.group()
-                    break
-            # Fallback: raw text of parent
-            if not date:
-                m = DATE_RE.search(parent.get_text())
-                if m:
-                    date = m.group()
-
-        items.append({"title": title, "url": full_url, "date": date})
+
+        # Date: first YYYY-MM-DD in the enclosing <li> row (or the direct parent),
+        # found with one regex pass over the row's text around the link
+        row = next(a_tag.iterancestors("li"), a_tag.getparent())
+        date = _row_date(row.text_content(), a_tag.text_content()) if row is not None else ""
+
+        items[full_url] = Item(title, full_url, date)
 
     return items
 
 
-def scrape_college(college: dict) -> dict:
+def parse_items_selectolax(tree: "LexborHTMLParser", base_url: str) -> dict[str, Item]:
+    """parse_items for a selectolax tree; same rules, same output."""
+    items: dict[str, Item] = {}
+
+    # selectolax has no regex attribute selector: narrow by suffix, confirm with the regex
+    for a_tag in tree.css("a[href$='/page.htm']"):
+        href = a_tag.attributes.get("href") or ""
+        if not ARTICLE_URL_SEARCH(href):
+            continue
+        title = a_tag.text(deep=True, separator="", strip=True)
+
+        if not title:
+            continue
+
+        full_url = urljoin(base_url, href.strip())
+
+        if full_url in items:
+            continue
+
+        # Date: enclosing <li> row (or the direct parent), as in parse_items
+        row = a_tag.parent
+        while row is not None and row.tag != "li":
+            row = row.parent
+        if row is None:
+            row = a_tag.parent
+
+        date = _row_date(row.text(deep=True), a_tag.text(deep=True)) if row is not None else ""
+
+        items[full_url] = Item(title, full_url, date)
+
+    return items
+
+
+def page_encoding(resp: requests.Response) -> str:
+    """
+    The page's charset: from Content-Type, else a <meta> in the first 1 KB,
+    else UTF-8 (what ZJU WebPlus serves). Never runs charset detection.
+    """
+    m = HEADER_CHARSET_RE.search(resp.headers.get("Content-Type", ""))
+    if m:
+        name = m.group(1)
+    else:
+        m = META_CHARSET_RE.search(resp.content[:1024])
+        name = m.group(1).decode("ascii") if m else "utf-8"
+    try:
+        name = codecs.lookup(name).name
+    except LookupError:
+        return "utf-8"
+    # Like browsers, read GB2312-labelled pages as GBK, its superset
+    return "gbk" if name == "gb2312" else name
+
+
+def parse_page(body: bytes, encoding: str, base_url: str) -> dict[str, Item] | None:
+    """
+    Parse a raw list page body (see parse_items); None if it cannot be parsed.
+    Takes and returns plain data so it can run in a worker process.
+    """
+    if LexborHTMLParser is not None:
+        # Lexbor reads bytes as UTF-8; only other charsets need decoding first
+        if encoding != "utf-8":
+            body = body.decode(encoding, "replace")
+        tree = LexborHTMLParser(body)
+        return parse_items_selectolax(tree, base_url)
+
+    # Raw bytes plus the resolved charset, so lxml does no guessing of its own
+    try:
+        tree = lxml.html.fromstring(body, parser=lxml.html.HTMLParser(encoding=encoding))
+    except etree.ParserError:
+        return None
+    return parse_items(tree, base_url)
+
+
+def _same_body(cached: dict, resp: requests.Response) -> bool:
+    """Whether the items in `cached` were parsed from the body `resp` carries."""
+    etag = resp.headers.get("ETag")
+    # A matching ETag means the same representation even when the server
+    # ignored the conditional request and sent the full page again
+    if etag and cached["etag"] == etag:
+        return True
+    # Last-Modified alone only has one-second resolution: trust it for cache hits
+    return (getattr(resp, "from_cache", False) and cached["etag"] == etag
+            and cached["last_modified"] == resp.headers.get("Last-Modified"))
+
+
+def _parsed_by(base_url: str) -> list:
+    """What produced a PAGE_CACHE_PATH entry's items; JSON-shaped, to compare after a reload."""
+    return [PAGE_PARSER_VERSION, base_url]
+
+
+def parse_executor(n_pages: int) -> Executor:
+    """
+    Executor for parse_page calls: worker processes for larger runs, else a
+    single background thread that still overlaps parsing with fetching.
+    Workers are spawned rather than forked: they start while the fetch
+    threads are running, and forking a multithreaded process can deadlock.
+    """
+    if n_pages < PARALLEL_PARSE_MIN_JOBS:
+        return ThreadPoolExecutor(max_workers=1)
+    return ProcessPoolExecutor(max_workers=min(n_pages, os.cpu_count() or 1),
+                               mp_context=multiprocessing.get_context("spawn"))
+
+
+def scrape_college(college: dict,
+                   pages: Iterable[tuple[str, dict[str, Item] | None]]) -> dict:
+    """
+    Collect items from a college's list pages.
+    `pages` yields (page_url, parsed items) in page order (see college_page_urls).
+    """
     list_url = college["list_url"]
-    base_url = college["base_url"]
     log.info("\n[INFO] Scraping %s …", college["name"])
 
-    all_items: list[dict] = []
-    seen_urls: set[str] = set()
+    all_items: dict[str, Item] = {}
 
-    for page_no in range(1, PAGES_TO_FETCH + 1):
-        page_url = make_page_url(list_url, page_no)
+    for page_no, (page_url, items) in enumerate(pages, start=1):
         log.info("  → %s", page_url)
-        soup = fetch_page(page_url)
-        if soup is None:
+        if items is None:
             log.error("  [ERROR] Could not fetch page %d, skipping.", page_no)
             break
 
-        items = parse_items(soup, base_url)
-        new_items = [i for i in items if i["url"] not in seen_urls]
-        seen_urls.update(i["url"] for i in new_items)
-        all_items.extend(new_items)
+        # Single check-and-insert per item; the first page a notice appears on wins
+        for url, item in items.items():
+            all_items.setdefault(url, item)
 
         if not items:
             log.warning("  [WARN] No items on page %d, stopping.", page_no)
             break
 
-        if page_no < PAGES_TO_FETCH:
-            time.sleep(1)
-
     log.info("  ✓ collected %d items", len(all_items))
 
     result: dict = {
         "id": college["id"],
         "name": college["name"],
         "source_url": list_url,
-        "items": all_items,
+        "items": [asdict(item) for item in all_items.values()],
     }
     if "note" in college:
         result["note"] = college["note"]
     return result
 
 
+class Scraper:
+    """
+    State for one scraping run: the (caching) HTTP session, per-host
+    politeness bookkeeping and the parsed-page cache (see PAGE_CACHE_PATH).
+    """
+
+    def __init__(self, cache: dict[str, dict] | None = None) -> None:
+        if requests_cache is not None:
+            self.session = requests_cache.CachedSession(
+                HTTP_CACHE_PATH,
+                backend="sqlite",
+                cache_control=True,
+                expire_after=HTTP_CACHE_EXPIRE_AFTER,
+                # Serve the last good copy when a site is down rather than dropping it
+                stale_if_error=True,
+            )
+        else:
+            self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        # Keep-alive pools for up to 8 hosts, each big enough for every worker
+        # thread, with urllib3 handling retry/backoff
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=MAX_WORKERS,
+            max_retries=Retry(total=3, backoff_factor=1.5,
+                              status_forcelist=[500, 502, 503, 504],
+                              allowed_methods=["GET"]),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.cache = cache if cache is not None else {}
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._host_next_fetch: dict[str, float] = {}
+        self._host_lock = threading.Lock()
+
+    def _host_slot(self, host: str) -> threading.BoundedSemaphore:
+        """Per-host semaphore capping concurrent requests to MAX_PER_HOST."""
+        with self._host_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(MAX_PER_HOST)
+        return slot
+
+    def _throttle(self, host: str) -> None:
+        """Sleep only as long as needed to keep MIN_HOST_INTERVAL between requests to `host`."""
+        with self._host_lock:
+            now = time.monotonic()
+            start = max(now, self._host_next_fetch.get(host, now))
+            self._host_next_fetch[host] = start + MIN_HOST_INTERVAL
+        if start > now:
+            time.sleep(start - now)
+
+    def fetch_page(self, url: str) -> requests.Response | None:
+        """GET a page; revalidation against the HTTP cache happens in the session."""
+        host = urlsplit(url).netloc
+        try:
+            with self._host_slot(host):
+                self._throttle(host)
+                return self.session.get(url, timeout=20)
+        except Exception as exc:
+            log.warning("  [WARN] failed to fetch %s: %s", url, exc)
+            return None
+
+    def fetch_pages(self, jobs: list[tuple[str, str]]
+                    ) -> dict[tuple[str, str], dict[str, Item] | None]:
+        """
+        Fetch (page_url, base_url) jobs concurrently and parse them.
+        Returns each job's items, or None if its page could not be fetched or parsed.
+        Each page URL is fetched once; jobs sharing it with different base URLs
+        get a parse each. Pages are handed to the parser as soon as their
+        response arrives, so parsing overlaps the fetches still in flight.
+        Responses carrying the same body the cached items were parsed from (see
+        _same_body), by this parser version with the same base URL (see
+        _parsed_by), reuse those items; other 200 responses refresh the cache.
+        """
+        pages: dict[tuple[str, str], dict[str, Item] | None] = dict.fromkeys(jobs)
+        base_urls: dict[str, list[str]] = {}
+        for url, base_url in pages:
+            base_urls.setdefault(url, []).append(base_url)
+        parsing: dict[Future, tuple[tuple[str, str], list, requests.Response]] = {}
+
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool, \
+                parse_executor(len(pages)) as parser:
+            fetches = {pool.submit(self.fetch_page, url): url for url in base_urls}
+            for fetch in as_completed(fetches):
+                url = fetches[fetch]
+                resp = fetch.result()
+                if resp is None:
+                    continue
+                cached = self.cache.get(url)
+                for base_url in base_urls[url]:
+                    job = (url, base_url)
+                    parsed_by = _parsed_by(base_url)
+                    if cached and cached.get("parsed_by") == parsed_by and _same_body(cached, resp):
+                        log.debug("  = %s unchanged, reusing parsed items", url)
+                        pages[job] = {item["url"]: Item(**item) for item in cached["items"]}
+                        continue
+                    parse = parser.submit(parse_page, resp.content, page_encoding(resp), base_url)
+                    parsing[parse] = (job, parsed_by, resp)
+
+        for parse, (job, parsed_by, resp) in parsing.items():
+            url = job[0]
+            try:
+                items = parse.result()
+            except Exception as exc:
+                # One bad page (or a dead worker process) must not sink the whole run
+                log.warning("  [WARN] could not parse %s: %s", url, exc)
+                continue
+            if items is None:
+                log.warning("  [WARN] could not parse %s", url)
+                continue
+            pages[job] = items
+
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+            if resp.status_code == 200 and (etag or last_modified):
+                self.cache[url] = {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "parsed_by": parsed_by,
+                    "items": [asdict(item) for item in items.values()],
+                }
+        return pages
+
+    def scrape(self, colleges: list[dict]) -> list[dict]:
+        """Scrape every college, fetching all their list pages together."""
+        jobs = {college["id"]: [(url, college["base_url"]) for url in college_page_urls(college)]
+                for college in colleges}
+        pages = self.fetch_pages([job for college_jobs in jobs.values() for job in college_jobs])
+        return [scrape_college(college, ((job[0], pages[job]) for job in jobs[college["id"]]))
+                for college in colleges]
+
+
+def dump_json(obj, indent: bool = True) -> bytes:
+    """Serialize as UTF-8 JSON; orjson and the stdlib fallback give identical bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def write_output(out_path: str, updated_at: str, colleges: list[dict]) -> bool:
+    """
+    Atomically write {"updated_at", "colleges"} to out_path (tmp file + os.replace).
+    Returns False without writing when the colleges data is unchanged. The
+    document is serialized once, and those bytes are compared with the existing
+    file's from the "colleges" key on (see OUTPUT_HEAD_RE); the timestamp before
+    it differs on every run.
+    """
+    payload = dump_json({"updated_at": updated_at, "colleges": colleges})
+    try:
+        with open(out_path, "rb") as f:
+            existing = f.read()
+    except OSError:
+        existing = b""
+    old_head = OUTPUT_HEAD_RE.match(existing)
+    if old_head and existing[old_head.end():] == payload[OUTPUT_HEAD_RE.match(payload).end():]:
+        return False
+
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, out_path)
+    return True
+
+
+def load_page_cache() -> dict[str, dict]:
+    try:
+        with open(PAGE_CACHE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_page_cache(cache: dict[str, dict]) -> None:
+    os.makedirs(os.path.dirname(PAGE_CACHE_PATH), exist_ok=True)
+    with open(PAGE_CACHE_PATH, "wb") as f:
+        f.write(dump_json(cache, indent=False))
+
+
 def main() -> None:
     log.info("=== ZJU Bulletin Board Scraper ===")
 
-    results = []
-    for college in COLLEGES:
-        data = scrape_college(college)
-        results.append(data)
-        time.sleep(2)
+    scraper = Scraper(load_page_cache())
+    results = scraper.scrape(COLLEGES)
+    save_page_cache(scraper.cache)
 
     # China Standard Time (UTC+8)
     cst = timezone(timedelta(hours=8))
     updated_at = datetime.now(cst).strftime("%Y-%m-%d %H:%M:%S CST")
 
-    output = {
-        "updated_at": updated_at,
-        "colleges": results,
-    }
-
     # Write to docs/data.json (relative to repo root)
-    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    out_path = os.path.join(repo_root, "docs", "data.json")
+    out_path = os.path.join(REPO_ROOT, "docs", "data.json")
     os.makedirs(os.path.dirname(out_path), exist_ok=True)
 
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
+    if not write_output(out_path, updated_at, results):
+        log.info("\n✅  No changes, left %s untouched", out_path)
+        return
 
     total = sum(len(c["items"]) for c in results)
     log.info("\n✅  Wrote %d items to %s", total, out_path)
@@ -0,0 +1,113 @@
+"""
+The list-page extractors must agree: parse_items (lxml) and parse_items_selectolax (Lexbor).
+Run from the repo root:  python -m unittest discover tests
+"""
+
+import unittest
+
+import lxml.html
+
+from scraper import scrape
+
+BASE = "http://www.sis.zju.edu.cn"
+
+HEAD = """<!DOCTYPE html><html><head><meta charset="utf-8">
+<link rel="stylesheet" href="/style.css"><title>通知公告</title></head><body>"""
+TAIL = "</body></html>"
+
+# One <li> per notice, each link inside it
+PLAIN_ROWS = HEAD + """
+<ul class="news_list">
+<li class="news n1"><span class="news_title">\
+<a href="/sischinese/2026/0310/c12577a3138747/page.htm" title="关于转专业">关于转专业拟接收名单公示</a>\
+</span><span class="news_meta">2026-03-10</span></li>
+<li><a href="/sischinese/2026/0306/c12577a3137959/page.htm">双学士学位项目 <b>增补</b></a>\
+<span>发布</span><span>2026-03-06</span></li>
+<li><a href="http://www.sis.zju.edu.cn/sischinese/2026/0213/c12577a3134640/page.htm">\
+绝对地址</a> 2026-02-13</li>
+<li><a href="/sischinese/2026/0306/c12577a3137959/page.htm">重复链接</a><span>2026-01-01</span></li>
+<li><a href="/sischinese/2026/0101/c1a1/page.htm"> <img src="/x.png"> </a></li>
+<li><span>2025-12-30</span>\
+<a href="/sischinese/2025/1230/c1a2/page.htm" title="2024-09-09">R&amp;D&nbsp;讲座</a></li>
+<li><a href='/sischinese/2025/1229/c1a3/page.htm' data-date="1999-01-01">无日期</a></li>
+<li><a href=/sischinese/2025/1228/c1a4/page.htm>无引号</a>\
+<span title="1998-01-01">2025-12-28</span></li>
+<li><a href="/sischinese/2026/0301/c12577a7/page.htm">2026-03-15至2026-03-20停电</a>\
+<span>2026-03-01</span></li>
+<li><a href="/sischinese/2026/0228/c12577a8/page.htm">2026-03-02起暂停办理</a></li>
+<li><a data-href="/nav/page.htm" href="/sischinese/12577/list2.htm">下一页</a></li>
+</ul>""" + TAIL
+
+UPPERCASE_ROWS = HEAD + """
+<UL>
+<LI><A HREF="/sischinese/2026/0311/c12577a1/page.htm">Upper</A><SPAN>2026-03-11</SPAN></LI>
+<LI><A HREF="/sischinese/2026/0312/c12577a2/page.htm">No date</A ></LI >
+</UL>""" + TAIL
+
+COMMENTED_ROWS = HEAD + """
+<ul>
+<!-- <li><a href="/sischinese/2020/0101/c1a9/page.htm">旧通知</a>\
+<span>2020-01-01</span></li> -->
+<li><a href="/sischinese/2026/0313/c12577a3/page.htm">正常<!-- 2019-01-01 --></a>\
+<span>2026-03-13</span></li>
+</ul>""" + TAIL
+
+# A featured link outside any <li>: its row is its parent <div>
+FEATURED_LINK = HEAD + """
+<div class="focus"><a href="/sischinese/2026/0201/c12577a4/page.htm">头条</a></div>
+<p>更新于 2026-02-02</p>
+<ul><li><a href="/sischinese/2026/0131/c12577a5/page.htm">普通</a>\
+<span>2026-01-31</span></li></ul>""" + TAIL
+
+NESTED_LIST = HEAD + """
+<ul><li><a href="/sischinese/2026/0120/c12577a6/page.htm">外层</a>
+<ul><li>2026-01-19</li></ul> 2026-01-20</li></ul>""" + TAIL
+
+
+def lxml_items(page: str) -> dict:
+    parser = lxml.html.HTMLParser(encoding="utf-8")
+    tree = lxml.html.fromstring(page.encode("utf-8"), parser=parser)
+    return scrape.parse_items(tree, BASE)
+
+
+def tree_results(page: str) -> list[dict]:
+    results = [lxml_items(page)]
+    if scrape.LexborHTMLParser is not None:
+        results.append(scrape.parse_items_selectolax(scrape.LexborHTMLParser(page), BASE))
+    return results
+
+
+class TreeParsersTest(unittest.TestCase):
+    def test_plain_rows(self):
+        items = lxml_items(PLAIN_ROWS)
+        self.assertEqual(
+            [(i.title, i.date) for i in items.values()],
+            [("关于转专业拟接收名单公示", "2026-03-10"), ("双学士学位项目增补", "2026-03-06"),
+             ("绝对地址", "2026-02-13"), ("R&D\xa0讲座", "2025-12-30"), ("无日期", ""),
+             ("无引号", "2025-12-28"), ("2026-03-15至2026-03-20停电", "2026-03-01"),
+             ("2026-03-02起暂停办理", "")],
+        )
+        self.assertEqual(next(iter(items)),
+                         BASE + "/sischinese/2026/0310/c12577a3138747/page.htm")
+
+    def test_parsers_agree(self):
+        for page in (PLAIN_ROWS, UPPERCASE_ROWS, COMMENTED_ROWS, FEATURED_LINK, NESTED_LIST):
+            results = tree_results(page)
+            for other in results[1:]:
+                self.assertEqual(other, results[0])
+
+
+class ParsePageTest(unittest.TestCase):
+    def test_featured_link_outside_rows(self):
+        items = scrape.parse_page(FEATURED_LINK.encode("utf-8"), "utf-8", BASE)
+        self.assertEqual(items, lxml_items(FEATURED_LINK))
+        self.assertEqual(items[BASE + "/sischinese/2026/0201/c12577a4/page.htm"].date, "")
+
+    def test_gbk(self):
+        page = PLAIN_ROWS.replace('charset="utf-8"', 'charset="gbk"')
+        self.assertEqual(scrape.parse_page(page.encode("gbk"), "gbk", BASE),
+                         lxml_items(PLAIN_ROWS))
+
+
+if __name__ == "__main__":
+    unittest.main()
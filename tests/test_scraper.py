@@ -0,0 +1,184 @@
+"""
+Scraper plumbing around the parsers: data.json writes and the parsed-page cache.
+Run from the repo root:  python -m unittest discover tests
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import requests
+
+from scraper import scrape
+
+COLLEGES = [{"id": "sis", "name": "外国语学院", "source_url": "http://x/list.htm",
+             "items": [{"title": "通知", "url": "http://x/2026/0301/c1a1/page.htm",
+                        "date": "2026-03-01"}]}]
+
+
+class WriteOutputTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        self.path = os.path.join(tmp.name, "data.json")
+
+    def read(self) -> bytes:
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def test_writes_new_file(self):
+        self.assertTrue(scrape.write_output(self.path, "2026-03-01 08:00:00 CST", COLLEGES))
+        self.assertEqual(self.read(), scrape.dump_json(
+            {"updated_at": "2026-03-01 08:00:00 CST", "colleges": COLLEGES}))
+        self.assertEqual(os.listdir(self.dir), ["data.json"])
+
+    def test_skips_when_only_timestamp_differs(self):
+        scrape.write_output(self.path, "2026-03-01 08:00:00 CST", COLLEGES)
+        before = self.read()
+        self.assertFalse(scrape.write_output(self.path, "2026-03-02 08:00:00 CST", COLLEGES))
+        self.assertEqual(self.read(), before)
+
+    def test_rewrites_changed_colleges(self):
+        scrape.write_output(self.path, "2026-03-01 08:00:00 CST", COLLEGES)
+        changed = [dict(COLLEGES[0], items=[])]
+        self.assertTrue(scrape.write_output(self.path, "2026-03-02 08:00:00 CST", changed))
+        self.assertIn(b'"2026-03-02 08:00:00 CST"', self.read())
+
+    def test_rewrites_other_layouts(self):
+        # Same data, but not in write_output's layout: rewritten rather than trusted
+        with open(self.path, "wb") as f:
+            f.write(scrape.dump_json({"updated_at": "x", "colleges": COLLEGES}, indent=False))
+        self.assertTrue(scrape.write_output(self.path, "2026-03-02 08:00:00 CST", COLLEGES))
+        with open(self.path, "wb") as f:
+            f.write(scrape.dump_json({"colleges": COLLEGES, "updated_at": "x"}))
+        self.assertTrue(scrape.write_output(self.path, "2026-03-02 08:00:00 CST", COLLEGES))
+
+
+LIST_PAGE = """<html><head><meta charset="utf-8"></head><body><ul>
+<li><a href="/s/2026/0301/c1a1/page.htm">通知</a><span>2026-03-01</span></li>
+</ul></body></html>""".encode("utf-8")
+
+
+def make_response(url: str, body: bytes = LIST_PAGE, **headers) -> requests.Response:
+    resp = requests.Response()
+    resp.url = url
+    resp.status_code = 200
+    resp._content = body
+    resp.headers.update({"Content-Type": "text/html; charset=utf-8", **headers})
+    return resp
+
+
+class FakeScraper(scrape.Scraper):
+    """Scraper whose fetch_page serves canned responses and records requested URLs."""
+
+    def __init__(self, responses: dict, cache: dict | None = None) -> None:
+        # Plain requests session: no sqlite HTTP cache in the repo's .cache/
+        with mock.patch.object(scrape, "requests_cache", None):
+            super().__init__(cache)
+        self.responses = responses
+        self.fetched: list[str] = []
+
+    def fetch_page(self, url: str) -> requests.Response | None:
+        self.fetched.append(url)
+        return self.responses.get(url)
+
+
+class FetchPagesTest(unittest.TestCase):
+    URL = "http://a.example/12577/list.htm"
+
+    def test_shared_url_fetched_once_parsed_per_base_url(self):
+        scraper = FakeScraper({self.URL: make_response(self.URL)})
+        pages = scraper.fetch_pages([(self.URL, "http://a.example"),
+                                     (self.URL, "http://b.example"),
+                                     (self.URL, "http://a.example")])
+        self.assertEqual(scraper.fetched, [self.URL])
+        self.assertEqual(list(pages[(self.URL, "http://a.example")]),
+                         ["http://a.example/s/2026/0301/c1a1/page.htm"])
+        self.assertEqual(list(pages[(self.URL, "http://b.example")]),
+                         ["http://b.example/s/2026/0301/c1a1/page.htm"])
+
+    def test_scrape_keeps_each_colleges_items(self):
+        colleges = [{"id": i, "name": i, "list_url": self.URL, "base_url": f"http://{i}.example"}
+                    for i in ("a", "b")]
+        scraper = FakeScraper({self.URL: make_response(self.URL)})
+        with mock.patch.object(scrape, "PAGES_TO_FETCH", 1):
+            results = scraper.scrape(colleges)
+        self.assertEqual([r["items"][0]["url"] for r in results],
+                         ["http://a.example/s/2026/0301/c1a1/page.htm",
+                          "http://b.example/s/2026/0301/c1a1/page.htm"])
+
+    def test_parse_error_only_drops_that_page(self):
+        bad = "http://a.example/12577/list2.htm"
+        broken = LIST_PAGE.replace("通知".encode("utf-8"), b"\xff")
+        scraper = FakeScraper({self.URL: make_response(self.URL), bad: make_response(bad, broken)})
+        parse_page = scrape.parse_page
+
+        def flaky_parse(body, encoding, base_url):
+            if body == broken:
+                raise UnicodeDecodeError("utf-8", body, 0, 1, "bad page")
+            return parse_page(body, encoding, base_url)
+
+        with mock.patch.object(scrape, "parse_page", flaky_parse), \
+                self.assertLogs(scrape.log, "WARNING") as logs:
+            pages = scraper.fetch_pages([(self.URL, "http://a.example"), (bad, "http://a.example")])
+        self.assertIsNone(pages[(bad, "http://a.example")])
+        self.assertEqual(len(pages[(self.URL, "http://a.example")]), 1)
+        self.assertIn("could not parse " + bad, logs.output[0])
+
+
+class SameBodyTest(unittest.TestCase):
+    CACHED = {"etag": '"abc"', "last_modified": "Sun, 01 Mar 2026 08:00:00 GMT"}
+
+    def response(self, from_cache: bool = False, **headers) -> requests.Response:
+        resp = make_response(FetchPagesTest.URL, **headers)
+        resp.from_cache = from_cache
+        return resp
+
+    def test_etag_match_reuses(self):
+        # Even when the server ignored If-None-Match and resent the whole page
+        self.assertTrue(scrape._same_body(self.CACHED, self.response(ETag='"abc"')))
+        self.assertFalse(scrape._same_body(self.CACHED, self.response(ETag='"def"')))
+
+    def test_last_modified_only_for_cache_hits(self):
+        cached = dict(self.CACHED, etag=None)
+        last_modified = {"Last-Modified": cached["last_modified"]}
+        self.assertTrue(scrape._same_body(cached, self.response(True, **last_modified)))
+        self.assertFalse(scrape._same_body(cached, self.response(**last_modified)))
+        self.assertFalse(scrape._same_body(cached, self.response(
+            True, **{"Last-Modified": "Mon, 02 Mar 2026 08:00:00 GMT"})))
+
+    def test_last_modified_needs_matching_etag(self):
+        resp = self.response(True, ETag='"def"', **{"Last-Modified": self.CACHED["last_modified"]})
+        self.assertFalse(scrape._same_body(self.CACHED, resp))
+
+
+class PageCacheTest(unittest.TestCase):
+    URL = FetchPagesTest.URL
+    BASE = "http://a.example"
+
+    def fetch(self, parsed_by: list) -> dict:
+        stale = {"title": "旧", "url": self.BASE + "/old/page.htm", "date": "2026-01-01"}
+        cache = {self.URL: {"etag": '"abc"', "last_modified": None,
+                            "parsed_by": parsed_by, "items": [stale]}}
+        scraper = FakeScraper({self.URL: make_response(self.URL, ETag='"abc"')}, cache)
+        items = scraper.fetch_pages([(self.URL, self.BASE)])[(self.URL, self.BASE)]
+        self.assertEqual(cache[self.URL]["parsed_by"], scrape._parsed_by(self.BASE))
+        return items
+
+    def test_same_body_and_parser_reuses_items(self):
+        items = self.fetch([scrape.PAGE_PARSER_VERSION, self.BASE])
+        self.assertEqual(list(items), [self.BASE + "/old/page.htm"])
+
+    def test_other_parser_version_reparses(self):
+        items = self.fetch([scrape.PAGE_PARSER_VERSION - 1, self.BASE])
+        self.assertEqual(list(items), [self.BASE + "/s/2026/0301/c1a1/page.htm"])
+
+    def test_other_base_url_reparses(self):
+        items = self.fetch([scrape.PAGE_PARSER_VERSION, "http://b.example"])
+        self.assertEqual(list(items), [self.BASE + "/s/2026/0301/c1a1/page.htm"])
+
+
+if __name__ == "__main__":
+    unittest.main()